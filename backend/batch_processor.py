@@ -9,9 +9,13 @@ Usage:
 """
 
 import asyncio
-import uuid
+import itertools
+import random
+import secrets
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import List, Optional, Dict, Type
+from typing import Iterator, List, Optional, Dict, Tuple, Type
+from urllib.parse import urlparse
 import argparse
 import logging
 import sys
@@ -35,6 +39,7 @@ from handlers.civicplus_handler import CivicPlusHandler
 from handlers.pdf_form_handler import PDFFormHandler
 from csv_reader import CSVReader
 from result_store import ResultStore
+from browser_pool import BrowserPool
 from utils.rate_limiter import RateLimiter
 
 # Configure logging
@@ -67,12 +72,18 @@ class BatchProcessor:
         WebFormHandler,  # Fallback - must be last
     ]
 
+    # How many entries to skip-check against the database at a time
+    RESUME_CHUNK_SIZE = 256
+
     def __init__(
         self,
         csv_path: str,
         db_path: str = "data/results.db",
         rate_limit_seconds: float = 30.0,
+        concurrency: int = 8,
         max_retries: int = 3,
+        retry_backoff_base: float = 2.0,
+        retry_backoff_cap: float = 300.0,
         resume: bool = True,
         headless: bool = False,
         name: Optional[str] = None,
@@ -88,7 +99,10 @@ class BatchProcessor:
             csv_path: Path to input CSV file
             db_path: Path to SQLite database
             rate_limit_seconds: Minimum seconds between submissions
+            concurrency: Number of forms processed in parallel
             max_retries: Maximum retry attempts for failed submissions
+            retry_backoff_base: Exponent base for retry backoff delays
+            retry_backoff_cap: Maximum backoff delay in seconds
             resume: Whether to skip already-processed forms
             headless: Run browser in headless mode
             name: Requester name (uses env default if not provided)
@@ -100,10 +114,17 @@ class BatchProcessor:
         self.csv_reader = CSVReader(csv_path)
         self.result_store = ResultStore(db_path)
         self.rate_limiter = RateLimiter(min_interval=rate_limit_seconds)
+        self.concurrency = max(1, concurrency)
         self.max_retries = max_retries
+        self.retry_backoff_base = retry_backoff_base
+        self.retry_backoff_cap = retry_backoff_cap
         self.resume = resume
         self.headless = headless
 
+        # Shared browser pool - browsers are reused across submissions
+        # instead of launching Chromium per form
+        self.browser_pool = BrowserPool(size=self.concurrency, headless=headless)
+
         # Contact info for handlers
         self.contact_info = {
             'name': name,
@@ -112,21 +133,52 @@ class BatchProcessor:
             'phone': phone,
             'password': password,
             'headless': headless,
+            'browser_pool': self.browser_pool,
         }
 
-        # Initialize handlers
-        self._handlers: Dict[FormType, BaseFormHandler] = {}
+        # Register handler classes (instances are created lazily so cold
+        # paths like --stats never pay handler startup costs)
         self._init_handlers()
 
-        # Batch tracking
+        # Batch tracking. Counters are only bumped from _count_result,
+        # a plain sync function with no awaits, so updates can't be
+        # interleaved under asyncio and no lock is needed.
         self.batch_id = None
         self.processed_count = 0
         self.success_count = 0
         self.failure_count = 0
 
+        # Result queue drained by a single writer task during process_all;
+        # None means results are written synchronously (process_single, retries)
+        self._results_q: Optional[asyncio.Queue] = None
+
     def _init_handlers(self):
-        """Initialize handler instances for each form type."""
+        """Register handler classes for each form type (no instantiation)."""
+        registered: Dict[FormType, Type[BaseFormHandler]] = {}
         for handler_class in self.HANDLERS:
+            for form_type in handler_class.SUPPORTED_FORM_TYPES:
+                if form_type not in registered:
+                    registered[form_type] = handler_class
+                    logger.debug(f"Registered {handler_class.HANDLER_NAME} for {form_type.name}")
+
+        # Dense dispatch table indexed by FormType.value (auto() values
+        # are small consecutive ints), with the generic web handler
+        # pre-filled as the fallback for unregistered types
+        self._fallback_class = registered.get(FormType.GENERIC_WEB)
+        self._class_table: List[Type[BaseFormHandler]] = (
+            [self._fallback_class] * (max(ft.value for ft in FormType) + 1)
+        )
+        for form_type, handler_class in registered.items():
+            self._class_table[form_type.value] = handler_class
+
+        # Lazily-created singleton instance per handler class
+        self._handler_instances: Dict[Type[BaseFormHandler], BaseFormHandler] = {}
+
+    def _get_handler_instance(self, handler_class: Type[BaseFormHandler]) -> BaseFormHandler:
+        """Get (or create on first use) the shared instance of a handler class."""
+        handler = self._handler_instances.get(handler_class)
+
+        if handler is None:
             # Only pass supported kwargs
             if handler_class == PDFFormHandler:
                 handler = handler_class(
@@ -137,21 +189,17 @@ class BatchProcessor:
                 )
             else:
                 handler = handler_class(**self.contact_info)
+            self._handler_instances[handler_class] = handler
 
-            for form_type in handler_class.SUPPORTED_FORM_TYPES:
-                if form_type not in self._handlers:
-                    self._handlers[form_type] = handler
-                    logger.debug(f"Registered {handler_class.HANDLER_NAME} for {form_type.name}")
+        return handler
 
     def get_handler(self, form_type: FormType) -> BaseFormHandler:
         """Get the appropriate handler for a form type."""
-        handler = self._handlers.get(form_type)
-
-        if not handler:
-            # Fall back to generic web handler
-            handler = self._handlers.get(FormType.GENERIC_WEB)
-
-        return handler
+        if form_type is None:
+            handler_class = self._fallback_class
+        else:
+            handler_class = self._class_table[form_type.value]
+        return self._get_handler_instance(handler_class)
 
     async def process_all(
         self,
@@ -172,61 +220,162 @@ class BatchProcessor:
         Returns:
             Summary statistics dict
         """
-        self.batch_id = str(uuid.uuid4())[:8]
+        self.batch_id = secrets.token_hex(4)
         logger.info(f"Starting batch {self.batch_id}")
 
-        # Read entries
-        entries = self.csv_reader.read_all()
-        logger.info(f"Loaded {len(entries)} form entries from CSV")
-
-        # Filter entries
-        if only_rank is not None:
-            entries = [e for e in entries if e.rank == only_rank]
-            logger.info(f"Filtered to rank {only_rank}: {len(entries)} entries")
+        # Stream entries through a single fused filter rather than
+        # materializing the CSV and re-allocating a list per predicate.
+        # The type filter is a precomputed bitmask over FormType.value;
+        # bit 0 stands in for unclassified entries (enum values start at 1).
+        allowed_type_mask = -1 if only_type is None else (1 << only_type.value)
+
+        def matches(e: FormEntry) -> bool:
+            type_bit = 1 << (e.form_type.value if e.form_type is not None else 0)
+            return bool(
+                (only_rank is None or e.rank == only_rank)
+                and (type_bit & allowed_type_mask)
+                and (only_census_id is None or e.census_id == only_census_id)
+            )
+
+        entries = (e for e in self.csv_reader.iter_entries() if matches(e))
+        if limit is not None:
+            entries = itertools.islice(entries, limit)
+
+        # Process entries with a bounded pool of workers. Submissions are
+        # I/O-bound (browser/HTTP), so many can be in flight at once while
+        # the rate limiter still throttles individual requests. The queue
+        # is bounded so memory stays O(concurrency) rather than O(N).
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [
+            asyncio.create_task(self._worker(queue))
+            for _ in range(self.concurrency)
+        ]
+
+        # Single writer drains results so SQLite commits never block the
+        # submission workers
+        self._results_q = asyncio.Queue(maxsize=256)
+        writer = asyncio.create_task(self._db_writer())
+
+        queued = 0
+        skipped = 0
+
+        async def enqueue_chunk(chunk):
+            """Enqueue a chunk, letting SQL filter out processed entries."""
+            nonlocal queued, skipped
+
+            unprocessed = None
+            if self.resume:
+                unprocessed = self.result_store.filter_unprocessed(
+                    entry.unique_id for _, entry in chunk
+                )
 
-        if only_type is not None:
-            entries = [e for e in entries if e.form_type == only_type]
-            logger.info(f"Filtered to type {only_type.name}: {len(entries)} entries")
+            pending = []
+            for i, entry in chunk:
+                if unprocessed is not None and entry.unique_id not in unprocessed:
+                    skipped += 1
+                    logger.info(f"[{i}] Skipping already processed: {entry.display_name}")
+                    continue
+                pending.append((i, entry))
+
+            # Interleave by host so consecutive same-host entries don't
+            # leave workers idling on the per-host rate limit
+            for i, entry in self._interleave_by_host(pending):
+                queued += 1
+                await queue.put((i, entry))
+
+        # Skip-check entries in chunks so resume never materializes the
+        # full processed-id set from the database
+        chunk = []
+        for i, entry in enumerate(entries, 1):
+            chunk.append((i, entry))
+            if len(chunk) >= self.RESUME_CHUNK_SIZE:
+                await enqueue_chunk(chunk)
+                chunk = []
+        if chunk:
+            await enqueue_chunk(chunk)
 
-        if only_census_id is not None:
-            entries = [e for e in entries if e.census_id == only_census_id]
-            logger.info(f"Filtered to census_id {only_census_id}: {len(entries)} entries")
+        await queue.join()
 
-        if limit is not None:
-            entries = entries[:limit]
-            logger.info(f"Limited to {limit} entries")
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-        # Get already processed IDs for resume
-        processed_ids = set()
-        if self.resume:
-            processed_ids = self.result_store.get_processed_ids()
-            logger.info(f"Resume mode: {len(processed_ids)} already processed")
+        # Flush any results still buffered for the writer
+        await self._results_q.join()
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        self._results_q = None
 
-        # Process entries
-        total = len(entries)
-        for i, entry in enumerate(entries, 1):
-            if entry.unique_id in processed_ids:
-                logger.info(f"[{i}/{total}] Skipping already processed: {entry.display_name}")
-                continue
-
-            logger.info(f"[{i}/{total}] Processing: {entry.display_name}")
-            await self._process_entry(entry)
+        logger.info(f"Batch {self.batch_id}: {queued} processed, {skipped} skipped")
 
         # Return summary
         return self.get_summary()
 
+    async def _worker(self, queue: asyncio.Queue):
+        """Drain entries from the queue until cancelled."""
+        while True:
+            i, entry = await queue.get()
+            try:
+                logger.info(f"[{i}] Processing: {entry.display_name}")
+                await self._process_entry(entry)
+            except Exception:
+                logger.exception(f"[{i}] Unexpected error processing {entry.display_name}")
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def _interleave_by_host(items: List[Tuple[int, FormEntry]]) -> Iterator[Tuple[int, FormEntry]]:
+        """
+        Round-robin entries across hosts.
+
+        A run of entries on one portal would otherwise serialize behind
+        the per-host rate limit while other hosts sit idle; spreading
+        them out keeps every worker busy.
+        """
+        buckets = defaultdict(deque)
+        for item in items:
+            buckets[urlparse(item[1].url).netloc].append(item)
+
+        while buckets:
+            for host in list(buckets):
+                yield buckets[host].popleft()
+                if not buckets[host]:
+                    del buckets[host]
+
+    async def _db_writer(self):
+        """
+        Drain submission results and persist them in batches.
+
+        Runs as the only database writer during a batch, so workers hand
+        off results and immediately move to their next submission instead
+        of waiting on a commit.
+        """
+        while True:
+            batch = [await self._results_q.get()]
+            while not self._results_q.empty() and len(batch) < 32:
+                batch.append(self._results_q.get_nowait())
+
+            try:
+                self.result_store.save_result_many(batch, batch_id=self.batch_id)
+            except Exception:
+                logger.exception(f"Failed to save batch of {len(batch)} results")
+            finally:
+                for result in batch:
+                    self._count_result(result)
+                    self._results_q.task_done()
+
     async def process_single(self, form_entry: FormEntry) -> SubmissionResult:
         """Process a single form entry."""
-        self.batch_id = self.batch_id or str(uuid.uuid4())[:8]
+        self.batch_id = self.batch_id or secrets.token_hex(4)
         return await self._process_entry(form_entry)
 
-    async def _process_entry(self, entry: FormEntry) -> SubmissionResult:
+    async def _process_entry(self, entry: FormEntry, retry_count: int = 0) -> SubmissionResult:
         """Process a single form entry."""
         logger.info(f"  URL: {entry.url}")
         logger.info(f"  Type: {entry.form_type.name if entry.form_type else 'UNKNOWN'}")
 
-        # Rate limiting
-        await self.rate_limiter.wait()
+        # Rate limiting (per-host, so unrelated portals don't wait on each other)
+        await self.rate_limiter.wait(entry.url)
 
         # Get handler
         handler = self.get_handler(entry.form_type)
@@ -234,41 +383,97 @@ class BatchProcessor:
 
         # Submit form
         result = await handler.submit(entry)
+        result.retry_count = retry_count
 
-        # Save result
-        self.result_store.save_result(result, batch_id=self.batch_id)
+        # Save result - hand off to the writer task when one is running
+        # (it also owns the counters), otherwise write and count here
+        if self._results_q is not None:
+            await self._results_q.put(result)
+        else:
+            self.result_store.save_result(result, batch_id=self.batch_id)
+            self._count_result(result)
 
-        # Update counters
-        self.processed_count += 1
         if result.status in (SubmissionStatus.SUCCESS, SubmissionStatus.PDF_DOWNLOADED):
-            self.success_count += 1
             logger.info(f"  RESULT: {result.status.value}")
             if result.confirmation_message:
                 logger.info(f"  {result.confirmation_message}")
         else:
-            self.failure_count += 1
             logger.warning(f"  RESULT: {result.status.value} - {result.failure_reason.value}")
             if result.error_message:
                 logger.warning(f"  Error: {result.error_message}")
 
         return result
 
+    def _count_result(self, result: SubmissionResult):
+        """Update batch counters for a saved result (single-writer only)."""
+        self.processed_count += 1
+        if result.status in (SubmissionStatus.SUCCESS, SubmissionStatus.PDF_DOWNLOADED):
+            self.success_count += 1
+        else:
+            self.failure_count += 1
+
     async def retry_failed(self) -> Dict:
-        """Retry previously failed submissions."""
+        """
+        Retry previously failed submissions.
+
+        Retries are spaced with exponential backoff plus full jitter so
+        correlated failures (portal outage, CAPTCHA wave) don't all hammer
+        the same server at once on the next attempt. Order doesn't matter
+        here, so retries run concurrently (bounded by a semaphore) and are
+        awaited as they complete - one slow portal doesn't stall the rest.
+        """
         failed_ids = self.result_store.get_failed_ids(self.max_retries)
         logger.info(f"Found {len(failed_ids)} failed submissions to retry")
 
-        entries = self.csv_reader.read_all()
-        entry_map = {e.unique_id: e for e in entries}
+        entry_map = self.csv_reader.by_unique_id()
+
+        sem = asyncio.Semaphore(self.concurrency)
 
-        for form_entry_id in failed_ids:
-            if form_entry_id in entry_map:
-                entry = entry_map[form_entry_id]
+        async def bounded_retry(entry: FormEntry, form_entry_id: str) -> SubmissionResult:
+            prior = self.result_store.get_result(form_entry_id)
+            attempt = prior.retry_count if prior else 0
+
+            # Back off before taking a concurrency slot so waiting
+            # doesn't block other retries
+            delay = self._retry_delay(attempt)
+            if delay > 0:
+                logger.info(f"Backing off {delay:.1f}s before retrying {entry.display_name}")
+                await asyncio.sleep(delay)
+
+            async with sem:
                 logger.info(f"Retrying: {entry.display_name}")
-                await self._process_entry(entry)
+                # The bumped count is persisted with the result, so the
+                # next backoff grows and get_failed_ids eventually gives
+                # up at max_retries
+                return await self._process_entry(entry, retry_count=attempt + 1)
+
+        tasks = [
+            asyncio.create_task(bounded_retry(entry_map[form_entry_id], form_entry_id))
+            for form_entry_id in failed_ids
+            if form_entry_id in entry_map
+        ]
+
+        for future in asyncio.as_completed(tasks):
+            try:
+                await future
+            except Exception:
+                logger.exception("Unexpected error during retry")
 
         return self.get_summary()
 
+    def _retry_delay(self, attempt: int) -> float:
+        """Compute a full-jitter backoff delay for a prior attempt count."""
+        base = min(self.retry_backoff_cap, self.retry_backoff_base ** (attempt + 1))
+        return random.uniform(0, base)
+
+    async def close(self):
+        """Release shared resources (pooled browsers, handler sessions)."""
+        await self.browser_pool.close()
+        for handler in self._handler_instances.values():
+            aclose = getattr(handler, 'aclose', None)
+            if aclose:
+                await aclose()
+
     def get_summary(self) -> Dict:
         """Get processing summary."""
         db_stats = self.result_store.get_statistics(batch_id=self.batch_id)
@@ -289,24 +494,34 @@ class BatchProcessor:
         """Print a formatted summary."""
         summary = self.get_summary()
 
-        print("\n" + "=" * 60)
-        print("BATCH PROCESSING COMPLETE")
-        print("=" * 60)
-        print(f"Batch ID:     {summary['batch_id']}")
-        print(f"Processed:    {summary['processed']}")
-        print(f"Success:      {summary['success']}")
-        print(f"Failed:       {summary['failed']}")
-        print(f"Success Rate: {summary['success_rate']:.1f}%")
+        # Build the whole report and write once instead of a syscall per line
+        lines = [
+            "",
+            "=" * 60,
+            "BATCH PROCESSING COMPLETE",
+            "=" * 60,
+            f"Batch ID:     {summary['batch_id']}",
+            f"Processed:    {summary['processed']}",
+            f"Success:      {summary['success']}",
+            f"Failed:       {summary['failed']}",
+            f"Success Rate: {summary['success_rate']:.1f}%",
+        ]
 
         if summary['database_stats']['by_status']:
-            print("\nBy Status:")
-            for status, count in summary['database_stats']['by_status'].items():
-                print(f"  {status}: {count}")
+            lines.append("\nBy Status:")
+            lines.extend(
+                f"  {status}: {count}"
+                for status, count in summary['database_stats']['by_status'].items()
+            )
 
         if summary['database_stats']['by_failure_reason']:
-            print("\nFailure Reasons:")
-            for reason, count in summary['database_stats']['by_failure_reason'].items():
-                print(f"  {reason}: {count}")
+            lines.append("\nFailure Reasons:")
+            lines.extend(
+                f"  {reason}: {count}"
+                for reason, count in summary['database_stats']['by_failure_reason'].items()
+            )
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def export_results(self, output_path: str):
         """Export results to CSV."""
@@ -316,19 +531,26 @@ class BatchProcessor:
         """Show statistics about the CSV file."""
         stats = self.csv_reader.get_statistics()
 
-        print("\n" + "=" * 60)
-        print("CSV FILE STATISTICS")
-        print("=" * 60)
-        print(f"Total Entries:          {stats['total_entries']}")
-        print(f"Unique Municipalities:  {stats['unique_municipalities']}")
-
-        print("\nBy Form Type:")
-        for form_type, count in sorted(stats['by_form_type'].items()):
-            print(f"  {form_type}: {count}")
+        lines = [
+            "",
+            "=" * 60,
+            "CSV FILE STATISTICS",
+            "=" * 60,
+            f"Total Entries:          {stats['total_entries']}",
+            f"Unique Municipalities:  {stats['unique_municipalities']}",
+            "\nBy Form Type:",
+        ]
+        lines.extend(
+            f"  {form_type}: {count}"
+            for form_type, count in sorted(stats['by_form_type'].items())
+        )
+        lines.append("\nBy State:")
+        lines.extend(
+            f"  {state}: {count}"
+            for state, count in sorted(stats['by_state'].items(), key=lambda x: -x[1])
+        )
 
-        print("\nBy State:")
-        for state, count in sorted(stats['by_state'].items(), key=lambda x: -x[1]):
-            print(f"  {state}: {count}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -350,6 +572,8 @@ Examples:
     parser.add_argument('--db', default='data/results.db', help='Database path')
     parser.add_argument('--rate-limit', type=float, default=30.0,
                         help='Seconds between submissions (default: 30)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Number of forms processed in parallel (default: 8)')
     parser.add_argument('--no-resume', action='store_true',
                         help='Process all entries, ignoring prior runs')
     parser.add_argument('--headless', action='store_true',
@@ -368,6 +592,10 @@ Examples:
                         help='Show CSV statistics and exit')
     parser.add_argument('--retry-failed', action='store_true',
                         help='Retry previously failed submissions')
+    parser.add_argument('--retry-backoff-base', type=float, default=2.0,
+                        help='Exponent base for retry backoff (default: 2)')
+    parser.add_argument('--retry-backoff-cap', type=float, default=300.0,
+                        help='Maximum retry backoff in seconds (default: 300)')
 
     args = parser.parse_args()
 
@@ -376,6 +604,9 @@ Examples:
         csv_path=args.csv_file,
         db_path=args.db,
         rate_limit_seconds=args.rate_limit,
+        concurrency=args.concurrency,
+        retry_backoff_base=args.retry_backoff_base,
+        retry_backoff_cap=args.retry_backoff_cap,
         resume=not args.no_resume,
         headless=args.headless,
     )
@@ -397,15 +628,18 @@ Examples:
             sys.exit(1)
 
     # Process
-    if args.retry_failed:
-        await processor.retry_failed()
-    else:
-        await processor.process_all(
-            only_rank=args.rank,
-            only_type=form_type,
-            only_census_id=args.census_id,
-            limit=args.limit,
-        )
+    try:
+        if args.retry_failed:
+            await processor.retry_failed()
+        else:
+            await processor.process_all(
+                only_rank=args.rank,
+                only_type=form_type,
+                only_census_id=args.census_id,
+                limit=args.limit,
+            )
+    finally:
+        await processor.close()
 
     # Print summary
     processor.print_summary()
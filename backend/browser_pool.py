@@ -0,0 +1,113 @@
+"""Shared pool of browser instances reused across form submissions."""
+
+import asyncio
+from typing import Optional, Dict
+import logging
+
+from browser_use import Browser
+
+logger = logging.getLogger(__name__)
+
+# Chromium flags that strip work a form-filling session never needs:
+# GPU compositing, canvas anti-aliasing, background-tab throttling,
+# audio, and crash reporting. Sandbox flags are deliberately absent -
+# these sessions visit untrusted municipal sites.
+CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--mute-audio',
+    '--disable-breakpad',
+    '--disable-infobars',
+]
+
+
+class BrowserPool:
+    """
+    Pool of warm browser_use Browser instances shared across handlers.
+
+    Launching Chromium is ~1-2s of fixed overhead per submission; reusing
+    already-running browsers removes it. Browsers are created lazily up to
+    `size`, kept alive between Agent runs (keep_alive=True so the agent
+    doesn't shut them down), and handed out via acquire()/release().
+    """
+
+    def __init__(
+        self,
+        size: int = 8,
+        headless: bool = False,
+        window_size: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize browser pool.
+
+        Args:
+            size: Maximum number of concurrently running browsers
+            headless: Run browsers in headless mode
+            window_size: Browser window dimensions
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.window_size = window_size or {'width': 1000, 'height': 700}
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._created = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> Browser:
+        """
+        Get a browser from the pool.
+
+        Returns an idle browser if available, launches a new one while
+        under capacity, otherwise waits for a release.
+        """
+        try:
+            return self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        async with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                logger.debug(f"Launching pooled browser ({self._created}/{self.size})")
+                return Browser(
+                    headless=self.headless,
+                    window_size=self.window_size,
+                    keep_alive=True,
+                    args=CHROMIUM_ARGS,
+                )
+
+        return await self._idle.get()
+
+    async def release(self, browser: Browser):
+        """
+        Return a browser to the pool for reuse.
+
+        Clears cookies so one municipality's session doesn't leak into
+        the next submission.
+        """
+        try:
+            await browser.clear_cookies()
+        except Exception:
+            logger.debug("Could not clear cookies on pooled browser", exc_info=True)
+
+        self._idle.put_nowait(browser)
+
+    async def close(self):
+        """Shut down all pooled browsers."""
+        while self._created > 0:
+            try:
+                browser = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                # Remaining browsers are still checked out; their holders
+                # are responsible for releasing them first.
+                break
+
+            try:
+                await browser.kill()
+            except Exception:
+                logger.warning("Error closing pooled browser", exc_info=True)
+
+            self._created -= 1
@@ -1,8 +1,9 @@
 """CSV file reader and form entry parser."""
 
 import csv
+from collections import Counter
 from pathlib import Path
-from typing import List, Optional, Iterator
+from typing import Dict, List, Optional, Iterator
 import logging
 
 from models.form_entry import FormEntry
@@ -11,6 +12,21 @@ from utils.url_classifier import URLClassifier
 
 logger = logging.getLogger(__name__)
 
+# Optional C-implemented CSV parser; the stdlib path remains the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Optional vectorized counting for statistics on large files
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class CSVReader:
     """
@@ -27,12 +43,68 @@ class CSVReader:
 
     REQUIRED_COLUMNS = ['census_id', 'municipality', 'state', 'rank', 'url']
 
+    # Portal names in the description column settle classification
+    # without touching the URL patterns. Checked in order with 'pdf'
+    # first, mirroring URLClassifier.classify_with_confidence: a
+    # DocumentCenter link described as "Direct PDF of the form" is a
+    # PDF even when the prose also name-drops the portal it links from.
+    DESCRIPTION_HINTS = (
+        ('pdf', FormType.PDF),
+        ('nextrequest', FormType.NEXTREQUEST),
+        ('justfoia', FormType.JUSTFOIA),
+        ('govqa', FormType.GOVQA),
+        ('civicplus', FormType.CIVICPLUS),
+        ('formcenter', FormType.CIVICPLUS),
+    )
+
     def __init__(self, csv_path: str):
         self.csv_path = Path(csv_path)
 
         if not self.csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
+        # Lazily-built index so repeated lookup calls parse the file once
+        self._entries: Optional[List[FormEntry]] = None
+        self._by_census: Dict[str, List[FormEntry]] = {}
+        self._by_type: Dict[FormType, List[FormEntry]] = {}
+        self._by_unique_id: Dict[str, FormEntry] = {}
+
+        # Columnar copies of the fields get_statistics counts over
+        # (numpy arrays when available, else None)
+        self._states = None
+        self._type_names = None
+
+    def _load_index(self) -> List[FormEntry]:
+        """Parse the CSV once and build lookup indexes keyed by census_id and form type."""
+        if self._entries is None:
+            self._entries = []
+            self._by_census = {}
+            self._by_type = {}
+            self._by_unique_id = {}
+
+            # PyArrow parses the whole file in C when available; the
+            # stdlib iterator handles it row-by-row otherwise
+            source = (
+                self._iter_entries_pyarrow() if HAS_PYARROW
+                else self.iter_entries()
+            )
+
+            for entry in source:
+                self._entries.append(entry)
+                self._by_census.setdefault(entry.census_id, []).append(entry)
+                self._by_unique_id[entry.unique_id] = entry
+                if entry.form_type is not None:
+                    self._by_type.setdefault(entry.form_type, []).append(entry)
+
+            if HAS_NUMPY:
+                self._states = np.array([e.state for e in self._entries])
+                self._type_names = np.array([
+                    e.form_type.name if e.form_type else 'UNKNOWN'
+                    for e in self._entries
+                ])
+
+        return self._entries
+
     def read_all(self, classify: bool = True) -> List[FormEntry]:
         """
         Read all entries from CSV file.
@@ -43,7 +115,10 @@ class CSVReader:
         Returns:
             List of FormEntry objects
         """
-        entries = list(self.iter_entries(classify=classify))
+        if classify:
+            entries = list(self._load_index())
+        else:
+            entries = list(self.iter_entries(classify=False))
         logger.info(f"Read {len(entries)} form entries from {self.csv_path}")
         return entries
 
@@ -55,36 +130,145 @@ class CSVReader:
             FormEntry objects
         """
         with open(self.csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # csv.reader returns plain lists; DictReader builds a fresh
+            # dict per row, roughly 2x slower on large files
+            reader = csv.reader(f)
+
+            header = next(reader, None)
+            if header is None:
+                return
 
-            # Validate columns
-            if reader.fieldnames:
-                missing = set(self.REQUIRED_COLUMNS) - set(reader.fieldnames)
-                if missing:
-                    raise ValueError(f"CSV missing required columns: {missing}")
+            # Validate columns and resolve their positions once
+            columns = {name: idx for idx, name in enumerate(header)}
+            missing = set(self.REQUIRED_COLUMNS) - set(columns)
+            if missing:
+                raise ValueError(f"CSV missing required columns: {missing}")
+
+            i_census = columns['census_id']
+            i_municipality = columns['municipality']
+            i_state = columns['state']
+            i_rank = columns['rank']
+            i_url = columns['url']
+            i_description = columns.get('description')
 
             for row in reader:
                 # Skip empty rows
-                if not row.get('url'):
+                if len(row) <= i_url or not row[i_url]:
                     continue
 
                 entry = FormEntry(
-                    census_id=row['census_id'],
-                    municipality=row['municipality'],
-                    state=row['state'],
-                    rank=int(row.get('rank', 1)),
-                    url=row['url'],
-                    description=row.get('description', ''),
+                    census_id=row[i_census],
+                    municipality=row[i_municipality],
+                    state=row[i_state],
+                    rank=int(row[i_rank] or 1),
+                    url=row[i_url],
+                    description=(
+                        row[i_description]
+                        if i_description is not None and len(row) > i_description
+                        else ''
+                    ),
                 )
 
                 if classify:
-                    entry.form_type = URLClassifier.classify(entry.url)
+                    entry.form_type = self._classify_entry(entry)
 
                 yield entry
 
+    @classmethod
+    def _classify_entry(cls, entry: FormEntry) -> FormType:
+        """
+        Classify an entry by URL, refining generic fallbacks with
+        description hints.
+
+        A specific URL match (host cached) always wins; hints only
+        upgrade entries the URL patterns couldn't place, e.g. a
+        DocumentCenter link whose description says it's a PDF form.
+        """
+        form_type = URLClassifier.classify(entry.url)
+
+        if form_type == FormType.GENERIC_WEB and entry.description:
+            description_lower = entry.description.lower()
+            for hint, hint_type in cls.DESCRIPTION_HINTS:
+                at = description_lower.find(hint)
+                while at != -1:
+                    # A hint on the far side of a comparison ("less
+                    # direct than the NextRequest portal") describes a
+                    # sibling entry, not this URL - skip those mentions
+                    if 'than' not in description_lower[max(0, at - 40):at]:
+                        return hint_type
+                    at = description_lower.find(hint, at + 1)
+
+        return form_type
+
+    def _iter_entries_pyarrow(self) -> Iterator[FormEntry]:
+        """
+        Yield classified entries using PyArrow's C CSV parser.
+
+        Same output as iter_entries(classify=True), ~10-50x faster
+        parsing on large files.
+        """
+        # Read every column as a string with NA detection off: type
+        # inference would strip leading zeros from all-numeric census
+        # ids (FIPS codes) and turn strings like "NA" into nulls. The
+        # stdlib path never does either, and the resume/retry indexes
+        # are keyed on these ids, so both paths must yield identical
+        # fields for the same file.
+        table = pa_csv.read_csv(
+            str(self.csv_path),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={
+                    name: pa.string()
+                    for name in (*self.REQUIRED_COLUMNS, 'description')
+                },
+                null_values=[],
+                strings_can_be_null=False,
+            ),
+        )
+
+        missing = set(self.REQUIRED_COLUMNS) - set(table.column_names)
+        if missing:
+            raise ValueError(f"CSV missing required columns: {missing}")
+
+        def column(name, default=None):
+            if name in table.column_names:
+                return table.column(name).to_pylist()
+            return [default] * table.num_rows
+
+        rows = zip(
+            column('census_id'),
+            column('municipality'),
+            column('state'),
+            column('rank'),
+            column('url'),
+            column('description', ''),
+        )
+
+        for census_id, municipality, state, rank, url, description in rows:
+            # Skip empty rows
+            if not url:
+                continue
+
+            entry = FormEntry(
+                census_id=str(census_id),
+                municipality=str(municipality),
+                state=str(state),
+                rank=int(rank or 1),
+                url=url,
+                description=str(description) if description else '',
+            )
+            entry.form_type = self._classify_entry(entry)
+
+            yield entry
+
+    def by_unique_id(self) -> Dict[str, FormEntry]:
+        """Get the cached unique_id -> FormEntry map (parses at most once)."""
+        self._load_index()
+        return self._by_unique_id
+
     def get_by_census_id(self, census_id: str) -> List[FormEntry]:
         """Get all form entries for a specific census_id."""
-        return [e for e in self.iter_entries() if e.census_id == census_id]
+        self._load_index()
+        return list(self._by_census.get(census_id, []))
 
     def get_best_per_municipality(self) -> List[FormEntry]:
         """
@@ -93,29 +277,32 @@ class CSVReader:
         Returns:
             List of FormEntry objects with rank=1
         """
-        return [e for e in self.iter_entries() if e.rank == 1]
+        return [e for e in self._load_index() if e.rank == 1]
 
     def get_by_form_type(self, form_type: FormType) -> List[FormEntry]:
         """Get all entries of a specific form type."""
-        return [e for e in self.iter_entries() if e.form_type == form_type]
+        self._load_index()
+        return list(self._by_type.get(form_type, []))
 
     def get_statistics(self) -> dict:
         """Get statistics about the CSV contents."""
-        entries = self.read_all()
+        entries = self._load_index()
 
-        stats = {
+        if self._states is not None:
+            # np.unique counts in C over the cached columnar arrays
+            types, type_counts = np.unique(self._type_names, return_counts=True)
+            states, state_counts = np.unique(self._states, return_counts=True)
+            by_type = dict(zip(types.tolist(), type_counts.tolist()))
+            by_state = dict(zip(states.tolist(), state_counts.tolist()))
+        else:
+            by_type = dict(Counter(
+                e.form_type.name if e.form_type else 'UNKNOWN' for e in entries
+            ))
+            by_state = dict(Counter(e.state for e in entries))
+
+        return {
             'total_entries': len(entries),
-            'unique_municipalities': len(set(e.census_id for e in entries)),
-            'by_form_type': {},
-            'by_state': {},
+            'unique_municipalities': len(self._by_census),
+            'by_form_type': by_type,
+            'by_state': by_state,
         }
-
-        for entry in entries:
-            # Count by form type
-            type_name = entry.form_type.name if entry.form_type else 'UNKNOWN'
-            stats['by_form_type'][type_name] = stats['by_form_type'].get(type_name, 0) + 1
-
-            # Count by state
-            stats['by_state'][entry.state] = stats['by_state'].get(entry.state, 0) + 1
-
-        return stats
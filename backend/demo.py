@@ -26,9 +26,7 @@ from datetime import datetime
 
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "=" * 60)
-    print(f"  {title}")
-    print("=" * 60)
+    sys.stdout.write("\n" + "=" * 60 + f"\n  {title}\n" + "=" * 60 + "\n")
 
 
 def demo_csv_parsing(csv_path: str):
@@ -1,20 +1,78 @@
 import asyncio
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from browser_use import Agent, Browser, ChatOpenAI
+from browser_use import Agent, ChatOpenAI
 from typing import Optional
 
+from browser_pool import BrowserPool
+from handlers import _step_stats
+from submission_cache import SubmissionCache
+from utils.llm_cache import CachingChat
+
 load_dotenv()
 
+# Resolve environment constants once at import instead of per call
+_OPENROUTER_MODEL = os.getenv('OPENROUTER_MODEL')
+_OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
+_DEFAULT_NAME = os.getenv('DEFAULT_NAME', 'John Doe')
+_DEFAULT_EMAIL = os.getenv('DEFAULT_EMAIL', 'test@example.com')
+_DEFAULT_ADDRESS = os.getenv('DEFAULT_ADDRESS', '123 Main St, City, State, ZIP')
+_DEFAULT_PHONE = os.getenv('DEFAULT_PHONE', '')
+_DEFAULT_PASSWORD = os.getenv('DEFAULT_PASSWORD', '')
+
+
+# Completed submissions persisted across runs so a re-run doesn't
+# re-file a request that already went through
+_submission_cache = None
+
+
+def get_submission_cache() -> SubmissionCache:
+    global _submission_cache
+    if _submission_cache is None:
+        _submission_cache = SubmissionCache()
+    return _submission_cache
+
+
+# Warm Chromium instances shared across submissions; launching a
+# fresh browser per form costs 1-2 s and ~250 MB
+_browser_pool = None
+
+
+def get_browser_pool(size: int = 4) -> BrowserPool:
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(
+            size=size,
+            headless=False,
+            window_size={'width': 1000, 'height': 700},
+        )
+    return _browser_pool
+
+
+async def close_browser_pool():
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
+
+
+# Shared LLM client so concurrent submissions reuse one connection pool
+_llm = None
+
 
 def get_llm():
-    return ChatOpenAI(
-        model=os.getenv('OPENROUTER_MODEL'),
-        base_url="https://openrouter.ai/api/v1",
-        api_key=os.getenv('OPENROUTER_API_KEY')
-    )
+    global _llm
+    if _llm is None:
+        _llm = CachingChat(ChatOpenAI(
+            model=_OPENROUTER_MODEL,
+            base_url="https://openrouter.ai/api/v1",
+            api_key=_OPENROUTER_API_KEY
+        ))
+    return _llm
 
 
+@lru_cache(maxsize=4096)
 def get_request_text(municipality: str) -> str:
     return (
         f"Could you please send me {municipality}'s municipal zoning code as of 1940? "
@@ -23,42 +81,26 @@ def get_request_text(municipality: str) -> str:
     )
 
 
-async def fill_and_submit_form(
-    form_url: str,
-    municipality: str,
-    name: Optional[str] = None,
-    email: Optional[str] = None,
-    address: Optional[str] = None,
-    phone: Optional[str] = None,
-    password: Optional[str] = None,
-    additional_fields: Optional[dict] = None,
-    max_steps: int = 30,
-    interactive: bool = True
-) -> dict:
-    name = name or os.getenv('DEFAULT_NAME', 'John Doe')
-    email = email or os.getenv('DEFAULT_EMAIL', 'test@example.com')
-    address = address or os.getenv('DEFAULT_ADDRESS', '123 Main St, City, State, ZIP')
-    phone = phone or os.getenv('DEFAULT_PHONE', '')
-    password = password or os.getenv('DEFAULT_PASSWORD', '')
-    additional_fields = additional_fields or {}
-    request_text = get_request_text(municipality)
-
-    field_list = f"""
-    Name: {name}
-    Email: {email}
-    Address: {address}"""
-
-    if phone:
-        field_list += f"\n    Phone: {phone}"
-
-    field_list += f"\n    Request Description: {request_text}"
-
-    for field_name, field_value in additional_fields.items():
-        field_list += f"\n    {field_name}: {field_value}"
+@lru_cache(maxsize=8)
+def _build_task_prefix(
+    name: str,
+    email: str,
+    address: str,
+    phone: str,
+    password: str,
+) -> str:
+    """
+    Build the instruction block shared by every municipality.
 
-    task = f"""
+    Contact details are constant across a batch, so this returns a
+    byte-identical prefix for every call - the per-form specifics
+    (URL, municipality, request text) are appended after it, which
+    lets the LLM provider's prompt-prefix cache skip re-encoding the
+    bulk of the prompt on each of the agent's steps.
+    """
+    return f"""
     - Your goal is to fill out and submit a public records request form with the provided information.
-    - Navigate to {form_url}
+    - The specific form URL and request details are listed at the END of this task under REQUEST DETAILS.
 
     - FIRST, check if there is a sign in button, login link, or authentication requirement on the page.
     - If you see a sign in button or login link:
@@ -96,7 +138,7 @@ async def fill_and_submit_form(
             - Submit and verify account creation
 
     - After handling authentication (or if no login required), proceed with the form:
-    - Scroll through the entire form. Use this information to fill out the entire form with these details: {field_list}. Use the done action to finish the task.
+    - Scroll through the entire form. Use the REQUEST DETAILS at the end to fill out the entire form. Use the done action to finish the task.
 
     - Follow these instructions carefully:
         - If anything pops up that blocks the form (cookie banners, dialogs, etc.), close it out and continue filling out the form.
@@ -110,10 +152,8 @@ async def fill_and_submit_form(
             - Name: {name}
             - Email: {email}
             - Address: {address}
-            - Phone: {phone}"""
-
-    task += f"""
-            - Request/Description/Subject: {request_text}
+            - Phone: {phone}
+            - Request/Description/Subject: use the Request Description from REQUEST DETAILS
 
             For DATE/CALENDAR FIELDS (like "Date Range From", "Date Range To"):
             - First attempt: Type the date directly in format MM/DD/YYYY (e.g., "01/01/1940")
@@ -126,20 +166,14 @@ async def fill_and_submit_form(
             - If asked about preferred delivery method, select "Email" if available
             - Fill out ALL dropdowns and selections, making educated guesses based on context
 
-        3) Use input_text action to fill out any additional fields:"""
-
-    for field_name, field_value in additional_fields.items():
-        task += f"""
-            - {field_name}: {field_value}"""
-
-    task += f"""
+        3) Use input_text action to fill out any additional fields listed under REQUEST DETAILS.
 
         4) CLICK THE SUBMIT BUTTON AND CHECK FOR A SUCCESS SCREEN. Once there is a success screen or confirmation message, complete your end task.
 
     - Before you start, create a step-by-step plan to complete the entire task. Make sure to delegate a step for each field to be filled out.
 
     *** IMPORTANT ***:
-        - Before completing every step, refer to this information for accuracy. It is structured in a way to help you fill out the form and is the source of truth.
+        - Before completing every step, refer to the REQUEST DETAILS for accuracy. It is structured in a way to help you fill out the form and is the source of truth.
         - You are not done until you have filled out EVERY field of the form (both required AND optional).
         - When you have completed the entire form, press the submit button to submit the request and use the done action once you have confirmed submission.
         - Make educated guesses for any fields not explicitly provided. For example:
@@ -156,38 +190,152 @@ async def fill_and_submit_form(
             Do not say "see above." Include a fully written out, human-readable summary at the very end.
     """
 
+
+async def fill_and_submit_form(
+    form_url: str,
+    municipality: str,
+    name: Optional[str] = None,
+    email: Optional[str] = None,
+    address: Optional[str] = None,
+    phone: Optional[str] = None,
+    password: Optional[str] = None,
+    additional_fields: Optional[dict] = None,
+    max_steps: int = 30,
+    interactive: bool = True,
+    force: bool = False
+) -> dict:
+    name = name or _DEFAULT_NAME
+    email = email or _DEFAULT_EMAIL
+    address = address or _DEFAULT_ADDRESS
+    phone = phone or _DEFAULT_PHONE
+    password = password or _DEFAULT_PASSWORD
+    additional_fields = additional_fields or {}
+    request_text = get_request_text(municipality)
+
+    # A prior successful run for this exact request means the form is
+    # already filed - skip the whole browser + LLM workflow
+    cache = get_submission_cache()
+    cache_key = SubmissionCache.make_key(municipality, form_url, request_text)
+    if not force:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print(f"Already submitted for {municipality} (cached) - skipping")
+            return cached
+
+    # Accumulate pieces and join once - repeated += reallocates the
+    # whole string each time
+    field_parts = [f"""
+    Name: {name}
+    Email: {email}
+    Address: {address}"""]
+
+    if phone:
+        field_parts.append(f"\n    Phone: {phone}")
+
+    field_parts.append(f"\n    Request Description: {request_text}")
+
+    for field_name, field_value in additional_fields.items():
+        field_parts.append(f"\n    {field_name}: {field_value}")
+
+    field_list = "".join(field_parts)
+
+    # Static instructions first (cache-friendly prefix), per-form
+    # specifics last
+    task = "".join((
+        _build_task_prefix(name, email, address, phone, password),
+        f"""
+    REQUEST DETAILS:
+    - Navigate to {form_url}
+    - Municipality: {municipality}
+    - Use this information to fill out the form: {field_list}
+    """,
+    ))
+
     print(f"Target: {municipality}")
     print(f"Form URL: {form_url}")
     print(f"Email: {email}")
     print(f"Request: {request_text[:80]}...")
 
     llm = get_llm()
-    browser = Browser(
-	    headless=False,
-	    window_size={'width': 1000, 'height': 700},
-    )
-    agent = Agent(task=task, llm=llm, use_vision="auto", browser=browser)
-
-    print("Starting agent...")
-    result = await agent.run(max_steps=max_steps)
+    pool = get_browser_pool()
+    browser = await pool.acquire()
+    try:
+        agent = Agent(task=task, llm=llm, use_vision="auto", browser=browser)
+
+        print("Starting agent...")
+        result = await agent.run(
+            max_steps=_step_stats.suggested_max_steps('form_filler', max_steps)
+        )
+        _step_stats.record('form_filler', _step_stats.steps_taken(result))
+    finally:
+        await pool.release(browser)
 
     print("Agent completed!")
 
+    # Only a run the agent itself marked successful counts as filed.
+    # A CAPTCHA block, timeout, or FORM_NOT_FOUND still returns a
+    # history without raising - caching those as successes would skip
+    # the municipality for the cache's whole TTL.
+    succeeded = bool(result is not None and result.is_successful())
+
+    if succeeded:
+        # Cache a JSON-safe record (the raw agent result object isn't
+        # serializable) so re-runs can skip this municipality
+        cache.put(cache_key, {
+            'success': True,
+            'municipality': municipality,
+            'form_url': form_url,
+            'result': None,
+            'error': None,
+            'cached': True,
+        })
+
     return {
-        'success': True,
+        'success': succeeded,
         'municipality': municipality,
         'form_url': form_url,
         'result': result,
-        'error': None,
+        'error': None if succeeded else 'Agent did not confirm submission',
     }
 
 
-async def main():
-    result = await fill_and_submit_form(
-        form_url="https://losgatosca.nextrequest.com/requests/new",
-        municipality="Los Gatos"
+async def run_batch(forms: list, concurrency: int = 8) -> list:
+    """
+    Run many fill_and_submit_form calls concurrently.
+
+    Each submission is independent and I/O-bound (browser waits, LLM
+    calls), so overlapping them with a bounded semaphore pipelines the
+    latency. Size concurrency to available RAM (~300 MB per headless
+    Chromium).
+
+    Args:
+        forms: List of keyword-argument dicts for fill_and_submit_form
+        concurrency: Maximum submissions in flight at once
+
+    Returns:
+        List of result dicts (or exceptions) aligned with the input
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bounded(kwargs: dict) -> dict:
+        async with sem:
+            return await fill_and_submit_form(**kwargs)
+
+    return await asyncio.gather(
+        *(bounded(form) for form in forms),
+        return_exceptions=True,
     )
 
+
+async def main():
+    try:
+        result = await fill_and_submit_form(
+            form_url="https://losgatosca.nextrequest.com/requests/new",
+            municipality="Los Gatos"
+        )
+    finally:
+        await close_browser_pool()
+
     print("\nFinal Result:")
     print(f"  Success: {result['success']}")
     if result['error']:
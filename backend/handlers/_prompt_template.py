@@ -0,0 +1,46 @@
+"""Shared task-prompt template for portal-specific form handlers.
+
+The portal handlers (NextRequest, JustFOIA, GovQA, CivicPlus) share the
+same prompt skeleton; only the portal guidance block and a few values
+differ. The skeleton is parsed once at import time so building a prompt
+is a single Template.substitute call instead of dozens of f-string
+interpolations per submission.
+
+The guidance blocks lead and the per-entry values trail: provider-side
+implicit prompt caching matches on exact leading tokens, so keeping the
+parts that are constant across a batch run (portal guidance,
+submission/stop instructions, credentials) at the front lets repeat
+submissions reuse the cached prefix while only the tail varies.
+"""
+
+from string import Template
+
+TASK_TEMPLATE = Template("""
+    You are submitting a public records request on $portal_intro.
+    $portal_block
+
+    For department/category dropdowns, choose in this priority order: $department_priority.
+
+    SUBMISSION:
+    - Submit the request
+    - Wait for the confirmation screen
+    - Capture any confirmation number, request ID, or ticket number shown
+    - Report the confirmation message
+
+    STOP CONDITIONS:
+    - CAPTCHA detected: Report "CAPTCHA_DETECTED"
+    - Login required and credentials don't work: Report "LOGIN_REQUIRED"
+    - This is a PDF download page (not a web form): Report "PDF_DOWNLOAD"
+    - Form not found on page: Report "FORM_NOT_FOUND"
+
+    --- TASK SPECIFIC ---
+    Navigate to $url - the portal for $municipality, $state.
+    $context_section
+    FORM FILLING:
+    - Name: $name
+    - Email: $email
+    - Address: $address
+    - Phone: $phone
+    - Request/Description: $request_text
+    - Date Range (if asked): 01/01/1940 to 12/31/1945
+    """)
@@ -0,0 +1,95 @@
+"""Rolling per-handler step-count history for adaptive max_steps.
+
+Most portal forms finish well under the configured step cap, but a run
+that misses its cap burns the remaining steps as extra LLM round
+trips. Recording how many steps each handler actually takes lets the
+cap tighten to p95 + headroom once enough samples exist; cold start
+keeps the configured default. History persists across runs as a small
+JSON file next to the results database.
+"""
+
+import atexit
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STATS_PATH = Path(__file__).parent.parent / 'data' / 'step_stats.json'
+WINDOW = 200
+MIN_SAMPLES = 20
+HEADROOM = 3
+
+_history: Dict[str, deque] = {}
+_loaded = False
+_dirty = False
+
+
+def _load():
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    try:
+        raw = json.loads(STATS_PATH.read_text(encoding='utf-8'))
+        for name, values in raw.items():
+            _history[name] = deque(values, maxlen=WINDOW)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug(f"Could not load step stats from {STATS_PATH}", exc_info=True)
+
+
+def steps_taken(agent_result) -> Optional[int]:
+    """Extract the step count from a browser-use agent result, if possible."""
+    try:
+        if hasattr(agent_result, 'number_of_steps'):
+            return int(agent_result.number_of_steps())
+        if hasattr(agent_result, 'history'):
+            return len(agent_result.history)
+    except Exception:
+        return None
+    return None
+
+
+def record(handler_name: str, steps: Optional[int]):
+    """Add one observed step count to the handler's rolling window."""
+    global _dirty
+    if not steps or steps <= 0:
+        return
+    _load()
+    _history.setdefault(handler_name, deque(maxlen=WINDOW)).append(int(steps))
+    _dirty = True
+
+
+def suggested_max_steps(handler_name: str, default: int) -> int:
+    """
+    Step cap for a handler: p95 of observed runs plus headroom, never
+    above the configured default, falling back to the default until
+    MIN_SAMPLES runs have been seen.
+    """
+    _load()
+    history = _history.get(handler_name)
+    if not history or len(history) < MIN_SAMPLES:
+        return default
+    ordered = sorted(history)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return min(default, p95 + HEADROOM)
+
+
+def _save():
+    if not _dirty:
+        return
+    try:
+        STATS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        STATS_PATH.write_text(
+            json.dumps({name: list(values) for name, values in _history.items()}),
+            encoding='utf-8',
+        )
+    except Exception:
+        logger.debug(f"Could not persist step stats to {STATS_PATH}", exc_info=True)
+
+
+atexit.register(_save)
@@ -1,17 +1,60 @@
 """Abstract base class for all form handlers."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
+import asyncio
 import os
 import logging
 
+from dotenv import load_dotenv
+
 from models.form_entry import FormEntry
 from models.submission_result import SubmissionResult
 from models.enums import SubmissionStatus, FailureReason, FormType
 
+# .env must be loaded before the import-time default resolution below
+load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _Defaults:
+    """Contact-info defaults resolved from the environment once at import."""
+    name: str
+    email: str
+    address: str
+    phone: str
+    password: str
+
+
+# Environment lookups decode through os.environ on every call; batch
+# runs construct many handlers, so resolve the defaults a single time
+_DEFAULTS = _Defaults(
+    name=os.getenv('DEFAULT_NAME', 'John Doe'),
+    email=os.getenv('DEFAULT_EMAIL', 'test@example.com'),
+    address=os.getenv('DEFAULT_ADDRESS', '123 Main St, City, State 12345'),
+    phone=os.getenv('DEFAULT_PHONE', ''),
+    password=os.getenv('DEFAULT_PASSWORD', ''),
+)
+
+
+@lru_cache(maxsize=4096)
+def get_request_text(municipality: str) -> str:
+    """
+    Generate the standard request text for a municipality.
+
+    Municipalities repeat across a batch (retries, multiple forms per
+    town), so the formatted text is memoized.
+    """
+    return (
+        f"Could you please send me {municipality}'s municipal zoning code as of 1940? "
+        f"If a zoning code didn't exist then, could you send me the first post 1940 "
+        f"adoption of the zoning code?"
+    )
+
+
 class BaseFormHandler(ABC):
     """Abstract base class for all form handlers."""
 
@@ -19,6 +62,10 @@ class BaseFormHandler(ABC):
     SUPPORTED_FORM_TYPES: List[FormType] = []
     HANDLER_NAME: str = "base"
 
+    # Slots keep per-instance memory down and make attribute reads
+    # direct offset loads; subclasses declare their own additions
+    __slots__ = ('name', 'email', 'address', 'phone', 'password')
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -37,11 +84,11 @@ class BaseFormHandler(ABC):
             phone: Requester phone (optional)
             password: Password for authenticated portals (optional)
         """
-        self.name = name or os.getenv('DEFAULT_NAME', 'John Doe')
-        self.email = email or os.getenv('DEFAULT_EMAIL', 'test@example.com')
-        self.address = address or os.getenv('DEFAULT_ADDRESS', '123 Main St, City, State 12345')
-        self.phone = phone or os.getenv('DEFAULT_PHONE', '')
-        self.password = password or os.getenv('DEFAULT_PASSWORD', '')
+        self.name = name or _DEFAULTS.name
+        self.email = email or _DEFAULTS.email
+        self.address = address or _DEFAULTS.address
+        self.phone = phone or _DEFAULTS.phone
+        self.password = password or _DEFAULTS.password
 
     @classmethod
     def can_handle(cls, form_type: FormType) -> bool:
@@ -66,13 +113,49 @@ class BaseFormHandler(ABC):
         """
         pass
 
-    def get_request_text(self, municipality: str) -> str:
-        """Generate the standard request text."""
-        return (
-            f"Could you please send me {municipality}'s municipal zoning code as of 1940? "
-            f"If a zoning code didn't exist then, could you send me the first post 1940 "
-            f"adoption of the zoning code?"
-        )
+    async def submit_batch(
+        self,
+        form_entries: List[FormEntry],
+        additional_fields: Optional[Dict[str, Any]] = None,
+    ) -> List[SubmissionResult]:
+        """
+        Submit a list of forms, returning results aligned with the input.
+
+        Subclasses that can amortize per-submission setup (shared
+        browser, warm connections) override this; the default just
+        submits one at a time.
+        """
+        return [
+            await self.submit(form_entry, additional_fields)
+            for form_entry in form_entries
+        ]
+
+    async def submit_many(
+        self,
+        form_entries: List[FormEntry],
+        additional_fields: Optional[Dict[str, Any]] = None,
+        concurrency: int = 8,
+    ) -> List[SubmissionResult]:
+        """
+        Submit forms concurrently with bounded parallelism.
+
+        Submissions are independent and I/O-bound, so overlapping them
+        behind a semaphore pipelines browser and network waits. Results
+        come back aligned with the input list.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def bounded(form_entry: FormEntry) -> SubmissionResult:
+            async with sem:
+                return await self.submit(form_entry, additional_fields)
+
+        return list(await asyncio.gather(
+            *(bounded(form_entry) for form_entry in form_entries)
+        ))
+
+    # Staticmethod delegation so every handler shares one cache and
+    # the cached path skips instance-method binding
+    get_request_text = staticmethod(get_request_text)
 
     def create_result(
         self,
@@ -82,15 +165,17 @@ class BaseFormHandler(ABC):
         **kwargs
     ) -> SubmissionResult:
         """Create a SubmissionResult for the given form entry."""
+        # Positional for the leading fields - kwargs construction
+        # builds a throwaway dict per call
         return SubmissionResult(
-            form_entry_id=form_entry.unique_id,
-            census_id=form_entry.census_id,
-            municipality=form_entry.municipality,
-            state=form_entry.state,
-            url=form_entry.url,
-            status=status,
-            failure_reason=failure_reason,
-            form_type=form_entry.form_type.name if form_entry.form_type else None,
+            form_entry.unique_id,
+            form_entry.census_id,
+            form_entry.municipality,
+            form_entry.state,
+            form_entry.url,
+            status,
+            failure_reason,
+            form_type=form_entry.form_type_name,
             **kwargs
         )
 
@@ -2,8 +2,17 @@
 
 import os
 import asyncio
+import hashlib
+import json
+import mmap
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlsplit
 from datetime import datetime
 import aiohttp
 import logging
@@ -30,6 +39,40 @@ except ImportError:
     HAS_FILLPDF = False
     logger.warning("fillpdf not installed - PDF filling will be limited")
 
+try:
+    from pdfrw import (
+        PdfReader as RwReader,
+        PdfWriter as RwWriter,
+        PdfDict,
+        PdfName,
+        PdfObject,
+        PdfString,
+    )
+    HAS_PDFRW = True
+except ImportError:
+    HAS_PDFRW = False
+
+# Async file I/O so disk writes don't stall the event loop; plain
+# blocking writes are the fallback
+try:
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
+
+# Field-name listings keyed by (path, mtime_ns, size); a changed file
+# gets a new key, so stale entries invalidate themselves
+_field_names_cache: Dict[tuple, List[str]] = {}
+
+# AcroForm presence keyed the same way - see _has_acroform
+_acroform_cache: Dict[tuple, bool] = {}
+
+# Field-name mappings keyed by (PDF content hash, value keys); many
+# municipalities reuse the same state/county template, so the fuzzy
+# match runs once per template instead of per entry. Lives at module
+# level so each fill worker process keeps its own warm copy.
+_field_map_cache: Dict[tuple, Dict[str, str]] = {}
+
 
 class PDFFormHandler(BaseFormHandler):
     """
@@ -41,6 +84,9 @@ class PDFFormHandler(BaseFormHandler):
     SUPPORTED_FORM_TYPES = [FormType.PDF]
     HANDLER_NAME = "pdf_form"
 
+    __slots__ = ('download_dir', 'filled_dir', '_session', '_pdf_executor',
+                 '_validated_urls', '_host_sems', '_base_field_values')
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -58,6 +104,83 @@ class PDFFormHandler(BaseFormHandler):
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.filled_dir.mkdir(parents=True, exist_ok=True)
 
+        # Lazily-created shared HTTP session; per-download sessions pay
+        # a fresh TCP + TLS handshake for every PDF
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Dedicated process pool for CPU-bound PDF parsing/filling.
+        # pdfrw and PyPDF2 are pure Python, so threads serialize on the
+        # GIL; worker processes fill on real cores and stay warm across
+        # calls (libraries imported, per-process caches populated)
+        self._pdf_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+        )
+
+        # URL keys already fetched or revalidated this run - repeat
+        # encounters within a batch skip the network entirely
+        self._validated_urls: set = set()
+
+        # Cap concurrent downloads per municipal host; small town
+        # servers throttle or drop bursts, while cross-host
+        # parallelism stays unbounded
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+
+        # Contact info never changes between entries, so build the
+        # constant part of the fill values once instead of per PDF
+        self._base_field_values = {
+            'name': self.name,
+            'requestor': self.name,
+            'requester': self.name,
+            'applicant': self.name,
+            'email': self.email,
+            'e-mail': self.email,
+            'address': self.address,
+            'street': self.address,
+            'mailing': self.address,
+            'phone': self.phone,
+            'telephone': self.phone,
+        }
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared ClientSession, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=60),
+            )
+        return self._session
+
+    async def aclose(self):
+        """Release the shared HTTP session and the fill thread pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._pdf_executor.shutdown(wait=False)
+
+    async def submit_many(
+        self,
+        form_entries: List[FormEntry],
+        additional_fields: Optional[Dict[str, Any]] = None,
+        concurrency: int = 16,
+    ) -> List[SubmissionResult]:
+        """
+        Submit a batch of PDF entries concurrently.
+
+        PDF work is downloads plus thread-pool fills - far lighter than
+        a browser session - so the default parallelism is wider than
+        the base handler's. The per-host download semaphores still keep
+        any single municipal server from seeing more than a few
+        connections. Exceptions never escape submit(), so results come
+        back aligned with the input.
+        """
+        return await super().submit_many(
+            form_entries, additional_fields, concurrency
+        )
+
     async def submit(
         self,
         form_entry: FormEntry,
@@ -121,28 +244,125 @@ class PDFFormHandler(BaseFormHandler):
                 error_message=str(e)
             )
 
+    @staticmethod
+    def _is_valid_pdf(path: Path) -> bool:
+        try:
+            with open(path, 'rb') as f:
+                return f.read(4) == b'%PDF'
+        except OSError:
+            return False
+
     async def _download_pdf(self, form_entry: FormEntry) -> Optional[Path]:
-        """Download PDF from URL."""
+        """
+        Download PDF from URL, through a URL-keyed disk cache.
+
+        Batches re-encounter the same state/county template URLs many
+        times; a cached copy fetched earlier this run is reused without
+        touching the network, and copies from earlier runs are
+        revalidated with a conditional GET (ETag / Last-Modified) so an
+        unchanged PDF costs a 304 instead of a re-download.
+        """
         filename = f"{form_entry.census_id}_{form_entry.rank}_{form_entry.municipality.replace(' ', '_')}.pdf"
         filepath = self.download_dir / filename
 
+        url_key = hashlib.sha1(form_entry.url.encode('utf-8')).hexdigest()[:16]
+        cache_path = self.download_dir / '.urlcache' / f"{url_key}.pdf"
+        meta_path = cache_path.with_suffix('.meta')
+
+        # Same URL already fetched or revalidated this run
+        if url_key in self._validated_urls and self._is_valid_pdf(cache_path):
+            shutil.copyfile(cache_path, filepath)
+            logger.info(f"Reusing cached PDF for {form_entry.url}")
+            return filepath
+
+        # Conditional headers from a previous run's copy
+        headers = {}
+        if self._is_valid_pdf(cache_path):
+            try:
+                meta = json.loads(meta_path.read_text(encoding='utf-8'))
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            except (OSError, ValueError):
+                pass
+
+        host = urlsplit(form_entry.url).netloc
+        sem = self._host_sems.setdefault(host, asyncio.Semaphore(4))
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(form_entry.url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status == 200:
-                        content = await response.read()
-
-                        # Verify it's actually a PDF
-                        if content[:4] == b'%PDF':
-                            filepath.write_bytes(content)
-                            logger.info(f"Downloaded PDF to {filepath}")
-                            return filepath
-                        else:
-                            logger.warning(f"Downloaded content is not a PDF: {form_entry.url}")
-                            return None
+            session = await self._get_session()
+            async with sem, session.get(form_entry.url, headers=headers) as response:
+                if response.status == 304:
+                    self._validated_urls.add(url_key)
+                    shutil.copyfile(cache_path, filepath)
+                    logger.info(f"Cached PDF still current for {form_entry.url}")
+                    return filepath
+
+                if response.status != 200:
+                    logger.error(f"Failed to download PDF: HTTP {response.status}")
+                    return None
+
+                # Stream to disk in chunks - buffering whole PDFs in
+                # memory adds up with several downloads in flight
+                chunks = response.content.iter_chunked(64 * 1024)
+                try:
+                    first = await chunks.__anext__()
+                except StopAsyncIteration:
+                    logger.warning(f"Empty response body: {form_entry.url}")
+                    return None
+
+                # Verify it's actually a PDF before writing anything;
+                # close() aborts the transfer so an HTML error page
+                # isn't downloaded just to be thrown away
+                if first[:4] != b'%PDF':
+                    response.close()
+                    logger.warning(f"Downloaded content is not a PDF: {form_entry.url}")
+                    return None
+
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Write to a uniquely-named temp sibling and rename into
+                # place so a crash or cancellation mid-stream never
+                # leaves a half-written PDF in the cache. The random
+                # suffix keeps concurrent downloads of the same URL from
+                # interleaving into one temp file - each attempt
+                # publishes its own complete copy and the last rename
+                # wins atomically.
+                tmp_path = cache_path.with_name(
+                    f"{cache_path.name}.{os.urandom(8).hex()}.partial"
+                )
+                try:
+                    if HAS_AIOFILES:
+                        # Writes go through aiofiles' worker thread, so a
+                        # slow disk doesn't stall other in-flight downloads
+                        async with aiofiles.open(tmp_path, 'wb') as f:
+                            await f.write(first)
+                            async for chunk in chunks:
+                                await f.write(chunk)
                     else:
-                        logger.error(f"Failed to download PDF: HTTP {response.status}")
-                        return None
+                        with open(tmp_path, 'wb') as f:
+                            f.write(first)
+                            async for chunk in chunks:
+                                f.write(chunk)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+
+                try:
+                    meta_path.write_text(json.dumps({
+                        'url': form_entry.url,
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                    }), encoding='utf-8')
+                except OSError:
+                    logger.debug(f"Could not write cache metadata for {form_entry.url}")
+
+                self._validated_urls.add(url_key)
+                shutil.copyfile(cache_path, filepath)
+                logger.info(f"Downloaded PDF to {filepath}")
+                return filepath
         except Exception as e:
             logger.error(f"Error downloading PDF: {e}")
             return None
@@ -159,29 +379,20 @@ class PDFFormHandler(BaseFormHandler):
         Returns:
             Tuple of (filled_path or None, message describing result)
         """
-        if not HAS_FILLPDF and not HAS_PYPDF2:
-            return None, "No PDF library available (install PyPDF2 or fillpdf)"
+        if not HAS_FILLPDF and not HAS_PDFRW and not HAS_PYPDF2:
+            return None, "No PDF library available (install fillpdf, pdfrw, or PyPDF2)"
 
         request_text = self.get_request_text(form_entry.municipality)
+        today = datetime.now().strftime('%m/%d/%Y')
 
-        # Values to fill
+        # Entry-specific values layered over the precomputed contact info
         field_values = {
-            'name': self.name,
-            'requestor': self.name,
-            'requester': self.name,
-            'applicant': self.name,
-            'email': self.email,
-            'e-mail': self.email,
-            'address': self.address,
-            'street': self.address,
-            'mailing': self.address,
-            'phone': self.phone,
-            'telephone': self.phone,
+            **self._base_field_values,
             'description': request_text,
             'request': request_text,
             'records': request_text,
-            'date': datetime.now().strftime('%m/%d/%Y'),
-            'today': datetime.now().strftime('%m/%d/%Y'),
+            'date': today,
+            'today': today,
         }
 
         if additional_fields:
@@ -190,11 +401,13 @@ class PDFFormHandler(BaseFormHandler):
         filled_filename = f"{form_entry.census_id}_{form_entry.rank}_filled.pdf"
         filled_path = self.filled_dir / filled_filename
 
-        # Run in executor to not block async loop
-        loop = asyncio.get_event_loop()
+        # Run in the dedicated fill pool to not block the async loop.
+        # The plain function reference (not a bound method) keeps the
+        # submission picklable for the worker processes.
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
-            self._fill_pdf_sync,
+            self._pdf_executor,
+            PDFFormHandler._fill_pdf_sync,
             pdf_path,
             filled_path,
             field_values
@@ -202,19 +415,37 @@ class PDFFormHandler(BaseFormHandler):
 
         return result
 
+    @staticmethod
     def _fill_pdf_sync(
-        self,
         input_path: Path,
         output_path: Path,
         field_values: Dict[str, str]
     ) -> tuple[Optional[Path], str]:
-        """Synchronous PDF filling."""
+        """Synchronous PDF filling; runs inside a fill worker process."""
+
+        # Scanned zoning PDFs with no form at all are common; a raw
+        # byte scan rules them out before any library parses the file
+        if not PDFFormHandler._has_acroform(input_path):
+            return None, "PDF is not a fillable form (no AcroForm)"
+
+        # Stringify the paths once for the library calls below
+        in_s, out_s = os.fspath(input_path), os.fspath(output_path)
+
+        # Prefer pdfrw: one parse covers field discovery, mapping, and
+        # the write. fillpdf parses the document once in
+        # get_form_fields and again in write_fillable_pdf.
+        if HAS_PDFRW:
+            try:
+                return PDFFormHandler._fill_pdf_pdfrw(input_path, output_path, field_values)
+            except Exception as e:
+                logger.warning(f"pdfrw failed: {e}")
 
-        # Try fillpdf first (better field detection)
+        # Fall back to fillpdf (better detection of exotic field types,
+        # at the cost of a second parse)
         if HAS_FILLPDF:
             try:
                 # Get form fields from PDF
-                form_fields = fillpdfs.get_form_fields(str(input_path))
+                form_fields = fillpdfs.get_form_fields(in_s)
 
                 if not form_fields:
                     return None, "PDF has no fillable form fields"
@@ -222,15 +453,17 @@ class PDFFormHandler(BaseFormHandler):
                 logger.info(f"Found {len(form_fields)} form fields in PDF")
 
                 # Map our values to PDF field names
-                mapped_values = self._map_fields_to_pdf(field_values, form_fields)
+                mapped_values = PDFFormHandler._map_fields_to_pdf(input_path, field_values, form_fields)
 
                 if not mapped_values:
-                    return None, f"Could not map values to PDF fields. Fields found: {list(form_fields.keys())[:5]}"
+                    # islice takes the sample without materializing
+                    # every field name first
+                    return None, f"Could not map values to PDF fields. Fields found: {list(islice(form_fields, 5))}"
 
                 # Fill the form
                 fillpdfs.write_fillable_pdf(
-                    str(input_path),
-                    str(output_path),
+                    in_s,
+                    out_s,
                     mapped_values,
                     flatten=False
                 )
@@ -240,10 +473,10 @@ class PDFFormHandler(BaseFormHandler):
             except Exception as e:
                 logger.warning(f"fillpdf failed: {e}")
 
-        # Fall back to PyPDF2
+        # Last resort: PyPDF2
         if HAS_PYPDF2:
             try:
-                reader = PdfReader(str(input_path))
+                reader = PdfReader(in_s)
 
                 # Check for form fields
                 if '/AcroForm' not in reader.trailer.get('/Root', {}):
@@ -255,11 +488,12 @@ class PDFFormHandler(BaseFormHandler):
 
                 logger.info(f"Found {len(fields)} text fields via PyPDF2")
 
+                # append_pages_from_reader copies the page tree in one
+                # call (PyPDF2 3.0.x has no clone_from constructor)
                 writer = PdfWriter()
-                for page in reader.pages:
-                    writer.add_page(page)
+                writer.append_pages_from_reader(reader)
 
-                mapped_values = self._map_fields_to_pdf(field_values, fields)
+                mapped_values = PDFFormHandler._map_fields_to_pdf(input_path, field_values, fields)
 
                 if mapped_values:
                     writer.update_page_form_field_values(
@@ -272,7 +506,7 @@ class PDFFormHandler(BaseFormHandler):
 
                     return output_path, f"Filled {len(mapped_values)} fields"
                 else:
-                    return None, f"Could not map values to PDF fields. Fields: {list(fields.keys())[:5]}"
+                    return None, f"Could not map values to PDF fields. Fields: {list(islice(fields, 5))}"
 
             except Exception as e:
                 logger.warning(f"PyPDF2 failed: {e}")
@@ -280,32 +514,191 @@ class PDFFormHandler(BaseFormHandler):
 
         return None, "No PDF library succeeded"
 
+    @staticmethod
+    def _has_acroform(path: Path) -> bool:
+        """
+        Cheap check for an /AcroForm entry without parsing the PDF.
+
+        Memory-maps the file and scans for the literal name. A negative
+        is only trusted when the file has no compressed object streams,
+        since those can hide the catalog dictionary; anything uncertain
+        falls through to the real parsers. Results are cached by
+        (path, mtime_ns, size) alongside the field-name cache.
+        """
+        try:
+            stat = path.stat()
+            cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in _acroform_cache:
+            return _acroform_cache[cache_key]
+
+        try:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                has_form = (
+                    mm.find(b'/AcroForm') != -1
+                    or mm.find(b'/ObjStm') != -1
+                )
+        except (OSError, ValueError):
+            # Unreadable or empty file - let the parsers report it
+            has_form = True
+
+        if cache_key is not None:
+            _acroform_cache[cache_key] = has_form
+        return has_form
+
+    @staticmethod
+    def _fill_pdf_pdfrw(
+        input_path: Path,
+        output_path: Path,
+        field_values: Dict[str, str]
+    ) -> tuple[Optional[Path], str]:
+        """Fill AcroForm fields in place with pdfrw (single parse, no page re-copy)."""
+        template = RwReader(os.fspath(input_path))
+
+        if template.Root is None or template.Root.AcroForm is None:
+            return None, "PDF has no AcroForm (not a fillable PDF)"
+
+        # Collect named widget annotations across all pages
+        annotations = {}
+        for page in template.pages:
+            for annotation in (page.Annots or []):
+                if annotation.Subtype == PdfName.Widget and annotation.T:
+                    name = annotation.T.to_unicode() if hasattr(annotation.T, 'to_unicode') \
+                        else str(annotation.T).strip('()')
+                    annotations[name] = annotation
+
+        if not annotations:
+            return None, "PDF has no text form fields"
+
+        mapped_values = PDFFormHandler._map_fields_to_pdf(
+            input_path, field_values, dict.fromkeys(annotations)
+        )
+        if not mapped_values:
+            return None, (
+                f"Could not map values to PDF fields. "
+                f"Fields found: {list(islice(annotations, 5))}"
+            )
+
+        for name, value in mapped_values.items():
+            annotations[name].update(PdfDict(V=PdfString.encode(value), AP=None))
+
+        # Viewers regenerate field appearances from the new values
+        template.Root.AcroForm.update(PdfDict(NeedAppearances=PdfObject('true')))
+
+        RwWriter().write(os.fspath(output_path), template)
+        return output_path, f"Filled {len(mapped_values)} fields"
+
+    @staticmethod
     def _map_fields_to_pdf(
-        self,
+        input_path: Path,
         our_values: Dict[str, str],
         pdf_fields: Dict[str, Any]
     ) -> Dict[str, str]:
-        """Map our field values to actual PDF field names using fuzzy matching."""
-        mapped = {}
-        pdf_field_names = list(pdf_fields.keys())
+        """
+        Map our field values to actual PDF field names.
 
-        for pdf_field in pdf_field_names:
-            pdf_field_lower = pdf_field.lower()
+        The name-level mapping (which PDF field matches which of our
+        keys) depends only on the template, so it's cached by PDF
+        content hash; repeat fills of a shared template skip the fuzzy
+        match and just substitute values.
+        """
+        # Key order carries matching priority (e.g. 'name' before
+        # 'requestor'), so preserve it; empty values never match
+        our_keys = tuple(k for k, v in our_values.items() if v)
 
-            # Try to match each of our values to this PDF field
-            for our_key, our_value in our_values.items():
-                if not our_value:
-                    continue
+        cache_key = None
+        try:
+            digest = hashlib.sha1(input_path.read_bytes()).hexdigest()
+            cache_key = (digest, our_keys)
+        except OSError:
+            pass
+
+        name_map = _field_map_cache.get(cache_key) if cache_key else None
+        if name_map is None:
+            name_map = PDFFormHandler._match_field_names(list(pdf_fields.keys()), our_keys)
+            if cache_key is not None:
+                _field_map_cache[cache_key] = name_map
+
+        return {pdf_field: our_values[our_key] for pdf_field, our_key in name_map.items()}
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _key_pattern(our_keys: tuple):
+        """Compile one alternation scanning for every key at once.
+
+        The lookahead makes matches overlapping, so a key contained
+        inside another key's match is still found.
+        """
+        return re.compile('(?=(' + '|'.join(map(re.escape, our_keys)) + '))')
 
-                # Check if our key appears in the PDF field name
-                if our_key in pdf_field_lower:
-                    mapped[pdf_field] = our_value
-                    break
+    @staticmethod
+    def _match_field_names(pdf_field_names: List[str], our_keys: tuple) -> Dict[str, str]:
+        """
+        Match PDF field names to our value keys by substring.
 
-        return mapped
+        One compiled-regex pass per field name replaces the key-by-key
+        substring loop; among all keys found in a field name, the
+        earliest in our_keys (the priority order) wins, matching the
+        old loop's first-hit semantics.
+        """
+        if not our_keys:
+            return {}
+        pattern = PDFFormHandler._key_pattern(our_keys)
+        priority = {key: index for index, key in enumerate(our_keys)}
+        mapping = {}
+        for pdf_field in pdf_field_names:
+            hits = {m.group(1) for m in pattern.finditer(pdf_field.lower())}
+            if hits:
+                mapping[pdf_field] = min(hits, key=priority.__getitem__)
+        return mapping
 
     def get_field_names(self, pdf_path: Path) -> List[str]:
-        """Get list of fillable field names from a PDF."""
+        """
+        Get list of fillable field names from a PDF.
+
+        Results are cached module-wide keyed by path, mtime and size,
+        so callers peeking at fields right before a fill don't pay a
+        second parse of the same file.
+        """
+        try:
+            stat = pdf_path.stat()
+            cache_key = (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None:
+            cached = _field_names_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        names = self._read_field_names(pdf_path)
+        if cache_key is not None:
+            _field_names_cache[cache_key] = names
+        return names
+
+    @staticmethod
+    def _read_field_names(pdf_path: Path) -> List[str]:
+        """Parse the PDF and extract its field names (uncached)."""
+        if HAS_PDFRW:
+            try:
+                template = RwReader(str(pdf_path))
+                names = []
+                for page in template.pages:
+                    for annotation in (page.Annots or []):
+                        if annotation.Subtype == PdfName.Widget and annotation.T:
+                            names.append(
+                                annotation.T.to_unicode()
+                                if hasattr(annotation.T, 'to_unicode')
+                                else str(annotation.T).strip('()')
+                            )
+                if names:
+                    return names
+            except Exception:
+                pass
+
         if HAS_FILLPDF:
             try:
                 fields = fillpdfs.get_form_fields(str(pdf_path))
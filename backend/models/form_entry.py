@@ -1,6 +1,7 @@
 """Form entry data model representing a row from the CSV file."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from .enums import FormType
@@ -22,6 +23,16 @@ class FormEntry:
         """Unique identifier for this form entry."""
         return f"{self.census_id}_{self.rank}"
 
+    @cached_property
+    def form_type_name(self) -> Optional[str]:
+        """
+        Form type name for result records, computed once per entry.
+
+        Only read after classification - the cache sticks to whatever
+        form_type held on first access.
+        """
+        return self.form_type.name if self.form_type else None
+
     @property
     def display_name(self) -> str:
         """Human-readable name for logging."""
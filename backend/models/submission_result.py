@@ -7,7 +7,9 @@ from typing import Optional, Dict, Any
 from .enums import SubmissionStatus, FailureReason
 
 
-@dataclass
+# slots=True drops the per-instance __dict__; results are created in
+# the thousands on large batch runs and never grow ad-hoc attributes
+@dataclass(slots=True)
 class SubmissionResult:
     """Result of a form submission attempt."""
     form_entry_id: str
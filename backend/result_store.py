@@ -3,7 +3,7 @@
 import sqlite3
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Set
 from contextlib import contextmanager
 import logging
 
@@ -33,6 +33,10 @@ class ResultStore:
         """Context manager for database connections."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Per-connection pragmas; WAL itself is set once in _init_db
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA foreign_keys=ON")
         try:
             yield conn
             conn.commit()
@@ -45,6 +49,9 @@ class ResultStore:
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
+            # WAL keeps readers unblocked during batch writes and cuts
+            # fsync cost per commit (persists in the database file)
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS submissions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -90,33 +97,60 @@ class ResultStore:
 
     def save_result(self, result: SubmissionResult, batch_id: Optional[str] = None):
         """Save a submission result to the database."""
+        with self._get_connection() as conn:
+            self._upsert(conn, result, batch_id)
+
+    def save_result_many(
+        self,
+        results: List[SubmissionResult],
+        batch_id: Optional[str] = None,
+    ):
+        """
+        Save multiple results in a single transaction.
+
+        One commit (and one fsync) for the whole batch instead of one
+        per result.
+        """
+        if not results:
+            return
+
+        with self._get_connection() as conn:
+            for result in results:
+                self._upsert(conn, result, batch_id)
+
+    def _upsert(
+        self,
+        conn: sqlite3.Connection,
+        result: SubmissionResult,
+        batch_id: Optional[str],
+    ):
+        """Insert or update a single result on an open connection."""
         data = result.to_dict()
         data['batch_id'] = batch_id
         data['updated_at'] = datetime.now().isoformat()
 
-        with self._get_connection() as conn:
-            # Check if entry exists
-            existing = conn.execute(
-                "SELECT id FROM submissions WHERE form_entry_id = ?",
-                (result.form_entry_id,)
-            ).fetchone()
-
-            if existing:
-                # Update existing record
-                columns = ', '.join(f"{k} = ?" for k in data.keys())
-                values = list(data.values()) + [result.form_entry_id]
-                conn.execute(
-                    f"UPDATE submissions SET {columns} WHERE form_entry_id = ?",
-                    values
-                )
-            else:
-                # Insert new record
-                columns = ', '.join(data.keys())
-                placeholders = ', '.join('?' * len(data))
-                conn.execute(
-                    f"INSERT INTO submissions ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
+        # Check if entry exists
+        existing = conn.execute(
+            "SELECT id FROM submissions WHERE form_entry_id = ?",
+            (result.form_entry_id,)
+        ).fetchone()
+
+        if existing:
+            # Update existing record
+            columns = ', '.join(f"{k} = ?" for k in data.keys())
+            values = list(data.values()) + [result.form_entry_id]
+            conn.execute(
+                f"UPDATE submissions SET {columns} WHERE form_entry_id = ?",
+                values
+            )
+        else:
+            # Insert new record
+            columns = ', '.join(data.keys())
+            placeholders = ', '.join('?' * len(data))
+            conn.execute(
+                f"INSERT INTO submissions ({columns}) VALUES ({placeholders})",
+                list(data.values())
+            )
 
     def get_result(self, form_entry_id: str) -> Optional[SubmissionResult]:
         """Get a submission result by form entry ID."""
@@ -144,6 +178,45 @@ class ResultStore:
 
             return {row['form_entry_id'] for row in rows}
 
+    def filter_unprocessed(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of `ids` that have not been successfully processed.
+
+        The candidate ids are joined against the submissions table in SQL
+        (indexed on form_entry_id), so callers never need to materialize
+        the full processed-id set from a large database.
+        """
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS candidate_ids (
+                    form_entry_id TEXT PRIMARY KEY
+                )
+            """)
+            conn.execute("DELETE FROM candidate_ids")
+            conn.executemany(
+                "INSERT OR IGNORE INTO candidate_ids VALUES (?)",
+                ((form_entry_id,) for form_entry_id in ids)
+            )
+
+            rows = conn.execute(
+                """SELECT c.form_entry_id FROM candidate_ids c
+                   LEFT JOIN submissions s
+                     ON s.form_entry_id = c.form_entry_id
+                    AND s.status IN (?, ?, ?)
+                   WHERE s.form_entry_id IS NULL""",
+                (
+                    SubmissionStatus.SUCCESS.value,
+                    SubmissionStatus.EMAIL_SENT.value,
+                    SubmissionStatus.SKIPPED.value
+                )
+            ).fetchall()
+
+            return {row['form_entry_id'] for row in rows}
+
     def get_failed_ids(self, max_retries: int = 3) -> List[str]:
         """Get list of form_entry_ids that failed and can be retried."""
         with self._get_connection() as conn:
@@ -0,0 +1,91 @@
+"""Disk-backed cache of completed form submissions."""
+
+import hashlib
+import json
+import sqlite3
+import time
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_DAYS = 30
+
+
+class SubmissionCache:
+    """
+    SQLite-backed cache keyed by (municipality, form URL, request text).
+
+    Re-running a municipality that already submitted successfully -
+    after a code change, or inside a retry loop - otherwise repeats the
+    entire browser + LLM workflow for a form that is already filed. A
+    hit returns the stored result without launching anything. Entries
+    expire after `ttl_days`.
+    """
+
+    def __init__(self, db_path: str = "data/submission_cache.db",
+                 ttl_days: int = DEFAULT_TTL_DAYS):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self._init_db()
+
+    @contextmanager
+    def _get_connection(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS submissions (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    ts INTEGER NOT NULL
+                )
+            """)
+
+    @staticmethod
+    def make_key(municipality: str, form_url: str, request_text: str) -> str:
+        payload = f"{municipality}|{form_url}|{request_text}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached result dict, or None if absent or expired."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT result, ts FROM submissions WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        result_json, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            with self._get_connection() as conn:
+                conn.execute("DELETE FROM submissions WHERE key = ?", (key,))
+            return None
+        try:
+            return json.loads(result_json)
+        except (ValueError, TypeError):
+            logger.debug(f"Corrupt cache entry for key {key}; ignoring")
+            return None
+
+    def put(self, key: str, result: dict):
+        """Store a JSON-serializable result dict for the key."""
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO submissions (key, result, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(result), int(time.time())),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns how many were removed."""
+        cutoff = int(time.time()) - self.ttl_seconds
+        with self._get_connection() as conn:
+            cursor = conn.execute("DELETE FROM submissions WHERE ts < ?", (cutoff,))
+            return cursor.rowcount
@@ -2,8 +2,10 @@
 
 from .url_classifier import URLClassifier
 from .rate_limiter import RateLimiter
+from .llm_cache import CachingChat
 
 __all__ = [
     'URLClassifier',
     'RateLimiter',
+    'CachingChat',
 ]
@@ -0,0 +1,87 @@
+"""Response cache adapter for chat LLM clients."""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class CachingChat:
+    """
+    Wrap a chat LLM client with an in-memory response cache.
+
+    Agent steps within a batch are highly repetitive - the same portal
+    rendered for different municipalities produces byte-identical
+    message sequences for boilerplate steps (closing cookie banners,
+    clicking submit). On a hit the upstream call is skipped entirely,
+    saving both tokens and a network round trip.
+
+    Keys are hashes of the full serialized message list, so only
+    exactly-repeated contexts hit; a stale page state can never be
+    answered from cache. Entries expire after `ttl` seconds and the
+    oldest are evicted past `maxsize` (LRU).
+    """
+
+    def __init__(self, llm, maxsize: int = 1024, ttl: float = 3600.0):
+        self._llm = llm
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Per-run identifiers browser-use threads through every call; they
+    # don't affect the response, and hashing them would give every Agent
+    # its own key space so identical prompts could never share an entry
+    _VOLATILE_KWARGS = frozenset({'session_id'})
+
+    @classmethod
+    def _key(cls, messages, output_format, kwargs) -> str:
+        payload = (
+            repr(messages)
+            + repr(output_format)
+            + repr(sorted(
+                item for item in kwargs.items()
+                if item[0] not in cls._VOLATILE_KWARGS
+            ))
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        ts, response = entry
+        if time.monotonic() - ts > self._ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return response
+
+    def _put(self, key, response):
+        self._cache[key] = (time.monotonic(), response)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    async def ainvoke(self, messages, output_format=None, **kwargs):
+        # output_format is accepted positionally to match the wrapped
+        # BaseChatModel.ainvoke - browser-use calls ainvoke(messages, None)
+        key = self._key(messages, output_format, kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"LLM cache hit ({self.hits} hits / {self.misses} misses)")
+            return cached
+
+        self.misses += 1
+        response = await self._llm.ainvoke(messages, output_format, **kwargs)
+        self._put(key, response)
+        return response
+
+    def __getattr__(self, name):
+        # Everything else (model name, provider, invoke, ...) passes
+        # through to the wrapped client
+        return getattr(self._llm, name)
@@ -1,7 +1,9 @@
 """Rate limiting utility for spacing out form submissions."""
 
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlparse
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,37 +11,56 @@ logger = logging.getLogger(__name__)
 
 class RateLimiter:
     """
-    Simple rate limiter for async operations.
+    Per-host sliding-window rate limiter for async operations.
 
-    Ensures a minimum interval between operations to avoid
-    overwhelming municipal servers or triggering rate limits.
+    Buckets operations by URL host (netloc) so unrelated portals
+    (e.g. NextRequest vs JustFOIA) don't serialize behind each other,
+    while each municipal server still sees at most `max_requests`
+    operations per `min_interval`-second window.
     """
 
-    def __init__(self, min_interval: float = 30.0):
+    def __init__(self, min_interval: float = 30.0, max_requests: int = 1):
         """
         Initialize rate limiter.
 
         Args:
-            min_interval: Minimum seconds between operations
+            min_interval: Sliding window size in seconds per host
+            max_requests: Maximum operations per host within the window
         """
-        self.min_interval = timedelta(seconds=min_interval)
-        self.last_operation: datetime = None
+        self.min_interval = min_interval
+        self.max_requests = max(1, max_requests)
+        self._history: dict = defaultdict(deque)
+        self._locks: dict = defaultdict(asyncio.Lock)
 
-    async def wait(self):
-        """Wait until the minimum interval has passed since last operation."""
-        if self.last_operation is None:
-            self.last_operation = datetime.now()
-            return
+    async def wait(self, url: str = ""):
+        """
+        Wait until the host of `url` is below its rate limit.
+
+        Args:
+            url: URL of the upcoming operation; its netloc keys the bucket.
+                 An empty/unparseable URL falls back to a shared bucket.
+        """
+        host = urlparse(url).netloc if url else ""
+
+        async with self._locks[host]:
+            history = self._history[host]
+
+            while True:
+                now = time.monotonic()
+
+                # Drop timestamps that have aged out of the window
+                while history and now - history[0] >= self.min_interval:
+                    history.popleft()
 
-        elapsed = datetime.now() - self.last_operation
+                if len(history) < self.max_requests:
+                    break
 
-        if elapsed < self.min_interval:
-            wait_time = (self.min_interval - elapsed).total_seconds()
-            logger.debug(f"Rate limiting: waiting {wait_time:.1f}s")
-            await asyncio.sleep(wait_time)
+                wait_time = self.min_interval - (now - history[0])
+                logger.debug(f"Rate limiting {host or '(default)'}: waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
 
-        self.last_operation = datetime.now()
+            history.append(time.monotonic())
 
     def reset(self):
         """Reset the rate limiter."""
-        self.last_operation = None
+        self._history.clear()
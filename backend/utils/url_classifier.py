@@ -1,7 +1,9 @@
 """URL classification utility for determining form portal types."""
 
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import urlparse
 import sys
 import os
 
@@ -14,8 +16,8 @@ from models.enums import FormType
 class URLClassifier:
     """Classify form URLs into known portal types."""
 
-    # URL pattern rules (order matters - more specific first)
-    PATTERNS = [
+    # Host (netloc) pattern rules (order matters - more specific first)
+    HOST_PATTERNS = [
         # NextRequest portals
         (r'\.nextrequest\.com', FormType.NEXTREQUEST),
 
@@ -38,9 +40,14 @@ class URLClassifier:
         (r'openrecords\.pa\.gov', FormType.STATE_PORTAL),
         (r'texasattorneygeneral\.gov', FormType.STATE_PORTAL),
 
-        # CivicPlus FormCenter (check path patterns)
-        (r'/FormCenter/', FormType.CIVICPLUS),
+        # CivicPlus hosted sites
         (r'\.civicplus\.com', FormType.CIVICPLUS),
+    ]
+
+    # Path-dependent rules, checked only when the host doesn't match
+    PATH_PATTERNS = [
+        # CivicPlus FormCenter on municipality-owned domains
+        (r'/formcenter/', FormType.CIVICPLUS),
         (r'/forms\.aspx', FormType.CIVICPLUS),
 
         # PDF forms (extension check)
@@ -60,13 +67,28 @@ class URLClassifier:
         """
         url_lower = url.lower()
 
-        for pattern, form_type in cls.PATTERNS:
+        # Host-based rules are memoized, so every URL on an already-seen
+        # portal is a cache hit instead of a regex scan
+        form_type = cls._classify_host(urlparse(url_lower).netloc)
+        if form_type is not None:
+            return form_type
+
+        for pattern, form_type in cls.PATH_PATTERNS:
             if re.search(pattern, url_lower):
                 return form_type
 
         # Default to generic web form
         return FormType.GENERIC_WEB
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _classify_host(host: str) -> Optional[FormType]:
+        """Match a lowercased netloc against the host patterns (cached)."""
+        for pattern, form_type in URLClassifier.HOST_PATTERNS:
+            if re.search(pattern, host):
+                return form_type
+        return None
+
     @classmethod
     def classify_with_confidence(cls, url: str, description: str = "") -> Tuple[FormType, float]:
         """